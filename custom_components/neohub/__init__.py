@@ -6,12 +6,12 @@ import asyncio
 import logging
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, CONF_PORT, Platform
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 
-from .const import CONF_ACCESS_TOKEN, CONF_SSL, DEFAULT_SSL, DOMAIN
-from .coordinator import NeoHubCoordinator
+from .const import DOMAIN
+from .coordinator import NeoHubCoordinator, client_kwargs
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -21,33 +21,25 @@ PLATFORMS: list[Platform] = [
 ]
 
 STARTUP_TIMEOUT_SECONDS = 10
-STARTUP_POLL_INTERVAL = 0.5
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up DSC Neo from a config entry."""
-    coordinator = NeoHubCoordinator(
-        hass=hass,
-        host=entry.data[CONF_HOST],
-        port=entry.data[CONF_PORT],
-        ssl=entry.data.get(CONF_SSL, DEFAULT_SSL),
-        access_token=entry.data.get(CONF_ACCESS_TOKEN),
-    )
+    coordinator = NeoHubCoordinator(hass=hass, **client_kwargs(entry.data))
 
     if not await coordinator.async_setup():
         raise ConfigEntryNotReady("Failed to connect to DSC Neo")
 
-    attempts = int(STARTUP_TIMEOUT_SECONDS / STARTUP_POLL_INTERVAL)
-    for _ in range(attempts):
-        if coordinator.state:
-            break
-        await asyncio.sleep(STARTUP_POLL_INTERVAL)
-
     if not coordinator.state:
-        await coordinator.async_shutdown()
-        raise ConfigEntryNotReady(
-            "Connected but did not receive initial state from DSC Neo"
-        )
+        try:
+            await asyncio.wait_for(
+                coordinator.initial_state_ready(), STARTUP_TIMEOUT_SECONDS
+            )
+        except TimeoutError:
+            await coordinator.async_shutdown()
+            raise ConfigEntryNotReady(
+                "Connected but did not receive initial state from DSC Neo"
+            ) from None
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
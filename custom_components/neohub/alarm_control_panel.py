@@ -13,11 +13,10 @@ from homeassistant.components.alarm_control_panel import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, SIGNAL_CONNECTION_STATE, SIGNAL_STATE_UPDATED
+from .const import DOMAIN
 from .coordinator import NeoHubCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -41,23 +40,19 @@ async def async_setup_entry(
     """Set up DSC Neo alarm control panel entities."""
     coordinator: NeoHubCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities: list[DscAlarmPanel] = []
-    for session_id, session in coordinator.state.items():
-        session_name = session.get("name", f"DSC Neo {session_id}")
-        for partition in session.get("partitions", []):
-            entities.append(
-                DscAlarmPanel(
-                    coordinator=coordinator,
-                    session_id=session_id,
-                    session_name=session_name,
-                    partition_number=partition["partition_number"],
-                    partition_name=partition.get(
-                        "name",
-                        f"Partition {partition['partition_number']}",
-                    ),
-                    initial_status=partition.get("status", "unknown"),
-                )
-            )
+    device_info = coordinator.device_info
+    entities: list[DscAlarmPanel] = [
+        DscAlarmPanel(
+            coordinator=coordinator,
+            session_id=session_id,
+            device_info=device_info[session_id],
+            partition_number=partition_number,
+            partition_name=partition.get("name")
+            or f"Partition {partition_number}",
+            initial_status=partition.get("status", "unknown"),
+        )
+        for (session_id, partition_number), partition in coordinator.partitions.items()
+    ]
 
     async_add_entities(entities)
 
@@ -78,7 +73,7 @@ class DscAlarmPanel(AlarmControlPanelEntity):
         self,
         coordinator: NeoHubCoordinator,
         session_id: str,
-        session_name: str,
+        device_info: DeviceInfo,
         partition_number: int,
         partition_name: str,
         initial_status: str,
@@ -88,19 +83,10 @@ class DscAlarmPanel(AlarmControlPanelEntity):
         self._session_id = session_id
         self._partition_number = partition_number
         self._status = initial_status
+        self._attr_alarm_state = STATUS_MAP.get(initial_status)
         self._attr_unique_id = f"{session_id}_partition_{partition_number}"
         self._attr_name = partition_name
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, session_id)},
-            name=session_name,
-            manufacturer="DSC",
-            model="Neo",
-        )
-
-    @property
-    def alarm_state(self) -> AlarmControlPanelState | None:
-        """Return the current alarm state."""
-        return STATUS_MAP.get(self._status)
+        self._attr_device_info = device_info
 
     @property
     def available(self) -> bool:
@@ -108,32 +94,28 @@ class DscAlarmPanel(AlarmControlPanelEntity):
         return self._coordinator.connected
 
     async def async_added_to_hass(self) -> None:
-        """Register dispatch listeners when added to hass."""
+        """Register update listeners when added to hass."""
         self.async_on_remove(
-            async_dispatcher_connect(
-                self.hass,
-                f"{SIGNAL_STATE_UPDATED}_partition_{self._session_id}_{self._partition_number}",
-                self._handle_update,
+            self._coordinator.register_partition(
+                self._session_id, self._partition_number, self.apply_update
             )
         )
         self.async_on_remove(
-            async_dispatcher_connect(
-                self.hass,
-                SIGNAL_CONNECTION_STATE,
-                self._handle_connection_state,
+            self._coordinator.register_connection_listener(
+                self.async_write_ha_state
             )
         )
 
     @callback
-    def _handle_update(self, data: dict[str, Any]) -> None:
-        """Handle a partition state update."""
-        if "status" in data:
-            self._status = data["status"]
-        self.async_write_ha_state()
-
-    @callback
-    def _handle_connection_state(self, connected: bool) -> None:
-        """Handle a connection state change."""
+    def apply_update(self, data: dict[str, Any]) -> None:
+        """Apply a partition state update and write state if it changed."""
+        status = data.get("status")
+        if status is None or status == self._status:
+            return
+        self._status = status
+        self._attr_alarm_state = STATUS_MAP.get(status)
+        if self._attr_alarm_state is None:
+            _LOGGER.debug("Unmapped partition status: %s", status)
         self.async_write_ha_state()
 
     async def async_alarm_arm_away(self, code: str | None = None) -> None:
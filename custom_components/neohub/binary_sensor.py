@@ -11,11 +11,10 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, SIGNAL_CONNECTION_STATE, SIGNAL_STATE_UPDATED
+from .const import DOMAIN
 from .coordinator import NeoHubCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -40,24 +39,20 @@ async def async_setup_entry(
     """Set up DSC Neo binary sensor entities."""
     coordinator: NeoHubCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities: list[DscZoneSensor] = []
-    for session_id, session in coordinator.state.items():
-        session_name = session.get("name", f"DSC Neo {session_id}")
-        for zone in session.get("zones", []):
-            entities.append(
-                DscZoneSensor(
-                    coordinator=coordinator,
-                    session_id=session_id,
-                    session_name=session_name,
-                    zone_number=zone["zone_number"],
-                    zone_name=zone.get(
-                        "name", f"Zone {zone['zone_number']}"
-                    ),
-                    device_class_str=zone.get("device_class", ""),
-                    initial_open=zone.get("open", False),
-                    partition_list=zone.get("partitions", []),
-                )
-            )
+    device_info = coordinator.device_info
+    entities: list[DscZoneSensor] = [
+        DscZoneSensor(
+            coordinator=coordinator,
+            session_id=session_id,
+            device_info=device_info[session_id],
+            zone_number=zone_number,
+            zone_name=zone.get("name") or f"Zone {zone_number}",
+            device_class_str=zone.get("device_class", ""),
+            initial_open=zone.get("open", False),
+            partition_list=zone.get("partitions", []),
+        )
+        for (session_id, zone_number), zone in coordinator.zones.items()
+    ]
 
     async_add_entities(entities)
 
@@ -71,7 +66,7 @@ class DscZoneSensor(BinarySensorEntity):
         self,
         coordinator: NeoHubCoordinator,
         session_id: str,
-        session_name: str,
+        device_info: DeviceInfo,
         zone_number: int,
         zone_name: str,
         device_class_str: str,
@@ -82,24 +77,15 @@ class DscZoneSensor(BinarySensorEntity):
         self._coordinator = coordinator
         self._session_id = session_id
         self._zone_number = zone_number
-        self._partition_list = partition_list
+        self._partition_list = tuple(partition_list)
+        self._attr_extra_state_attributes = {"partitions": self._partition_list}
         self._attr_unique_id = f"{session_id}_zone_{zone_number}"
         self._attr_name = zone_name
         self._attr_is_on = initial_open
         self._attr_device_class = DEVICE_CLASS_MAP.get(device_class_str)
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, session_id)},
-            name=session_name,
-            manufacturer="DSC",
-            model="Neo",
-        )
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
-        return {
-            "partitions": self._partition_list,
-        }
+        if self._attr_device_class is None and device_class_str:
+            _LOGGER.debug("Unmapped zone device class: %s", device_class_str)
+        self._attr_device_info = device_info
 
     @property
     def available(self) -> bool:
@@ -107,32 +93,30 @@ class DscZoneSensor(BinarySensorEntity):
         return self._coordinator.connected
 
     async def async_added_to_hass(self) -> None:
-        """Register dispatch listeners when added to hass."""
+        """Register update listeners when added to hass."""
         self.async_on_remove(
-            async_dispatcher_connect(
-                self.hass,
-                f"{SIGNAL_STATE_UPDATED}_zone_{self._session_id}_{self._zone_number}",
-                self._handle_update,
+            self._coordinator.register_zone(
+                self._session_id, self._zone_number, self.apply_update
             )
         )
         self.async_on_remove(
-            async_dispatcher_connect(
-                self.hass,
-                SIGNAL_CONNECTION_STATE,
-                self._handle_connection_state,
+            self._coordinator.register_connection_listener(
+                self.async_write_ha_state
             )
         )
 
     @callback
-    def _handle_update(self, data: dict[str, Any]) -> None:
-        """Handle a zone state update."""
-        if "open" in data:
+    def apply_update(self, data: dict[str, Any]) -> None:
+        """Apply a zone state update and write state if it changed."""
+        changed = False
+        if "open" in data and data["open"] != self._attr_is_on:
             self._attr_is_on = data["open"]
+            changed = True
         if "partitions" in data:
-            self._partition_list = data["partitions"]
-        self.async_write_ha_state()
-
-    @callback
-    def _handle_connection_state(self, connected: bool) -> None:
-        """Handle a connection state change."""
-        self.async_write_ha_state()
+            partitions = tuple(data["partitions"])
+            if partitions != self._partition_list:
+                self._partition_list = partitions
+                self._attr_extra_state_attributes = {"partitions": partitions}
+                changed = True
+        if changed:
+            self.async_write_ha_state()
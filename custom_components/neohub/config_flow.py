@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -12,9 +13,12 @@ from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
 from homeassistant.const import CONF_HOST, CONF_PORT
 
 from .const import CONF_ACCESS_TOKEN, CONF_SSL, DEFAULT_PORT, DEFAULT_SSL, DOMAIN
+from .coordinator import client_kwargs
 
 _LOGGER = logging.getLogger(__name__)
 
+CONNECT_TEST_TIMEOUT = 5
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_HOST): str,
@@ -52,16 +56,12 @@ class NeoHubConfigFlow(ConfigFlow, domain=DOMAIN):
 
     async def _test_connection(self, data: dict[str, Any]) -> bool:
         """Test whether we can connect to the NeoHub WebSocket."""
-        client = NeoHubClient(
-            host=data[CONF_HOST],
-            port=data[CONF_PORT],
-            ssl=data.get(CONF_SSL, DEFAULT_SSL),
-            access_token=data.get(CONF_ACCESS_TOKEN),
-        )
+        client = NeoHubClient(**client_kwargs(data))
         try:
-            await client.connect()
-            await client.disconnect()
+            await asyncio.wait_for(client.connect(), CONNECT_TEST_TIMEOUT)
             return True
-        except NeoHubConnectionError:
+        except (NeoHubConnectionError, TimeoutError):
             _LOGGER.debug("Connection test failed", exc_info=True)
             return False
+        finally:
+            await client.disconnect()
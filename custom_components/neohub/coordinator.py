@@ -2,19 +2,32 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import Callable, Mapping
 from typing import Any
 
 from .pyneohub import NeoHubClient, NeoHubConnectionError
 
+from homeassistant.const import CONF_HOST, CONF_PORT
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.entity import DeviceInfo
 
-from .const import SIGNAL_CONNECTION_STATE, SIGNAL_STATE_UPDATED
+from .const import CONF_ACCESS_TOKEN, CONF_SSL, DEFAULT_SSL, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def client_kwargs(data: Mapping[str, Any]) -> dict[str, Any]:
+    """Return NeoHubClient keyword arguments from config entry data."""
+    return {
+        "host": data[CONF_HOST],
+        "port": data[CONF_PORT],
+        "ssl": data.get(CONF_SSL, DEFAULT_SSL),
+        "access_token": data.get(CONF_ACCESS_TOKEN),
+    }
+
+
 class NeoHubCoordinator:
     """Coordinator to manage NeoHub client and Home Assistant integration."""
 
@@ -35,7 +48,21 @@ class NeoHubCoordinator:
             access_token=access_token,
         )
 
-        self._unregister_callbacks: list = []
+        self._unregister_callbacks: tuple[Callable[[], None], ...] = ()
+        self._partition_subs: dict[
+            tuple[str, int], list[Callable[[dict[str, Any]], None]]
+        ] = {}
+        self._zone_subs: dict[
+            tuple[str, int], list[Callable[[dict[str, Any]], None]]
+        ] = {}
+        self._connection_listeners: list[Callable[[], None]] = []
+        self._last_connected: bool | None = None
+        self._partitions: dict[tuple[str, int], dict[str, Any]] = {}
+        self._zones: dict[tuple[str, int], dict[str, Any]] = {}
+        self._session_names: dict[str, str] = {}
+        self._device_info: dict[str, DeviceInfo] = {}
+        self._ident_sets: dict[str, frozenset[tuple[str, str]]] = {}
+        self._initial_state_event = asyncio.Event()
 
     @property
     def client(self) -> NeoHubClient:
@@ -52,6 +79,26 @@ class NeoHubCoordinator:
         """Return the current state."""
         return self._client.state
 
+    @property
+    def partitions(self) -> dict[tuple[str, int], dict[str, Any]]:
+        """Return partitions indexed by (session_id, partition_number)."""
+        return self._partitions
+
+    @property
+    def zones(self) -> dict[tuple[str, int], dict[str, Any]]:
+        """Return zones indexed by (session_id, zone_number)."""
+        return self._zones
+
+    @property
+    def session_names(self) -> dict[str, str]:
+        """Return session names indexed by session_id."""
+        return self._session_names
+
+    @property
+    def device_info(self) -> dict[str, DeviceInfo]:
+        """Return the shared DeviceInfo per session_id."""
+        return self._device_info
+
     async def async_setup(self) -> bool:
         """Set up the coordinator."""
         self._register_callbacks()
@@ -64,69 +111,173 @@ class NeoHubCoordinator:
 
         return True
 
+    def register_partition(
+        self,
+        session_id: str,
+        partition_number: int,
+        update_callback: Callable[[dict[str, Any]], None],
+    ) -> Callable[[], None]:
+        """Register a callback for updates to a partition.
+
+        Returns a function to unregister the callback.
+        """
+        key = (session_id, partition_number)
+        subs = self._partition_subs.setdefault(key, [])
+        subs.append(update_callback)
+
+        def _unregister() -> None:
+            subs.remove(update_callback)
+            if not subs:
+                self._partition_subs.pop(key, None)
+
+        return _unregister
+
+    def register_zone(
+        self,
+        session_id: str,
+        zone_number: int,
+        update_callback: Callable[[dict[str, Any]], None],
+    ) -> Callable[[], None]:
+        """Register a callback for updates to a zone.
+
+        Returns a function to unregister the callback.
+        """
+        key = (session_id, zone_number)
+        subs = self._zone_subs.setdefault(key, [])
+        subs.append(update_callback)
+
+        def _unregister() -> None:
+            subs.remove(update_callback)
+            if not subs:
+                self._zone_subs.pop(key, None)
+
+        return _unregister
+
+    async def initial_state_ready(self) -> None:
+        """Wait until the first full state has been received."""
+        await self._initial_state_event.wait()
+
+    def register_connection_listener(
+        self, listener: Callable[[], None]
+    ) -> Callable[[], None]:
+        """Register a listener for connection state changes.
+
+        Returns a function to unregister the listener.
+        """
+        self._connection_listeners.append(listener)
+
+        def _unregister() -> None:
+            self._connection_listeners.remove(listener)
+
+        return _unregister
+
     async def async_shutdown(self) -> None:
         """Shut down the coordinator."""
         for unregister in self._unregister_callbacks:
             unregister()
-        self._unregister_callbacks.clear()
+        self._unregister_callbacks = ()
 
         await self._client.disconnect()
 
     def _register_callbacks(self) -> None:
         """Register callbacks with the client."""
-        self._unregister_callbacks.append(
-            self._client.register_connection_callback(self._handle_connection)
-        )
-        self._unregister_callbacks.append(
-            self._client.register_disconnection_callback(self._handle_disconnection)
-        )
-        self._unregister_callbacks.append(
-            self._client.register_full_state_callback(self._handle_full_state)
-        )
-        self._unregister_callbacks.append(
+        self._unregister_callbacks = (
+            self._client.register_connection_callback(self._handle_connection),
+            self._client.register_disconnection_callback(self._handle_disconnection),
+            self._client.register_full_state_callback(self._handle_full_state),
             self._client.register_partition_update_callback(
                 self._handle_partition_update
-            )
-        )
-        self._unregister_callbacks.append(
-            self._client.register_zone_update_callback(self._handle_zone_update)
+            ),
+            self._client.register_zone_update_callback(self._handle_zone_update),
         )
 
+    def _notify_connection_state(self, connected: bool) -> None:
+        """Invoke connection listeners when the connected state changes."""
+        if self._last_connected == connected:
+            return
+        self._last_connected = connected
+
+        for listener in list(self._connection_listeners):
+            try:
+                listener()
+            except Exception:
+                _LOGGER.exception("Error in connection listener")
+
     def _handle_connection(self) -> None:
         """Handle connection event."""
-        async_dispatcher_send(self.hass, SIGNAL_CONNECTION_STATE, True)
+        self._notify_connection_state(True)
 
     def _handle_disconnection(self) -> None:
         """Handle disconnection event."""
         _LOGGER.warning("DSC Neo disconnected")
-        async_dispatcher_send(self.hass, SIGNAL_CONNECTION_STATE, False)
+        self._notify_connection_state(False)
+
+    def _notify_partition(
+        self, session_id: str, partition_number: int, data: dict[str, Any]
+    ) -> None:
+        """Invoke the callbacks registered for a partition."""
+        for update_callback in self._partition_subs.get(
+            (session_id, partition_number), ()
+        ):
+            try:
+                update_callback(data)
+            except Exception:
+                _LOGGER.exception("Error in partition update callback")
+
+    def _notify_zone(
+        self, session_id: str, zone_number: int, data: dict[str, Any]
+    ) -> None:
+        """Invoke the callbacks registered for a zone."""
+        for update_callback in self._zone_subs.get((session_id, zone_number), ()):
+            try:
+                update_callback(data)
+            except Exception:
+                _LOGGER.exception("Error in zone update callback")
 
     def _handle_full_state(self, data: dict[str, Any]) -> None:
         """Handle full_state message from client."""
+        self._partitions.clear()
+        self._zones.clear()
+        self._session_names.clear()
+        self._device_info.clear()
+
         for session in data.get("sessions", []):
             session_id = session.get("session_id")
             if session_id is None:
                 continue
 
+            session_name = session.get("name") or f"DSC Neo {session_id}"
+            self._session_names[session_id] = session_name
+
+            identifiers = self._ident_sets.get(session_id)
+            if identifiers is None:
+                identifiers = frozenset({(DOMAIN, session_id)})
+                self._ident_sets[session_id] = identifiers
+
+            self._device_info[session_id] = DeviceInfo(
+                identifiers=identifiers,
+                name=session_name,
+                manufacturer="DSC",
+                model="Neo",
+            )
+
             for partition in session.get("partitions", []):
                 pn = partition.get("partition_number")
                 if pn is None:
                     continue
-                async_dispatcher_send(
-                    self.hass,
-                    f"{SIGNAL_STATE_UPDATED}_partition_{session_id}_{pn}",
-                    partition,
-                )
+                pn = int(pn)
+                self._partitions[(session_id, pn)] = partition
+                self._notify_partition(session_id, pn, partition)
 
             for zone in session.get("zones", []):
                 zn = zone.get("zone_number")
                 if zn is None:
                     continue
-                async_dispatcher_send(
-                    self.hass,
-                    f"{SIGNAL_STATE_UPDATED}_zone_{session_id}_{zn}",
-                    zone,
-                )
+                zn = int(zn)
+                self._zones[(session_id, zn)] = zone
+                self._notify_zone(session_id, zn, zone)
+
+        self._initial_state_event.set()
 
     def _handle_partition_update(self, data: dict[str, Any]) -> None:
         """Handle partition_update message from client."""
@@ -136,11 +287,7 @@ class NeoHubCoordinator:
         if session_id is None or partition_number is None:
             return
 
-        async_dispatcher_send(
-            self.hass,
-            f"{SIGNAL_STATE_UPDATED}_partition_{session_id}_{partition_number}",
-            data,
-        )
+        self._notify_partition(session_id, int(partition_number), data)
 
     def _handle_zone_update(self, data: dict[str, Any]) -> None:
         """Handle zone_update message from client."""
@@ -150,9 +297,5 @@ class NeoHubCoordinator:
         if session_id is None or zone_number is None:
             return
 
-        async_dispatcher_send(
-            self.hass,
-            f"{SIGNAL_STATE_UPDATED}_zone_{session_id}_{zone_number}",
-            data,
-        )
+        self._notify_zone(session_id, int(zone_number), data)
 
@@ -1,6 +1,11 @@
 """Python library for NeoHub - WebSocket bridge for DSC Neo alarm panels."""
 
-from .client import NeoHubClient, NeoHubConnectionError, NeoHubError
+from .client import (
+    NeoHubClient,
+    NeoHubConnectionError,
+    NeoHubError,
+    install_fast_loop,
+)
 
 __version__ = "0.1.0"
 
@@ -8,4 +13,5 @@ __all__ = [
     "NeoHubClient",
     "NeoHubConnectionError",
     "NeoHubError",
+    "install_fast_loop",
 ]
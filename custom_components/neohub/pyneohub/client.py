@@ -3,17 +3,67 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
-from collections.abc import Callable
+import random
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 import aiohttp
+import orjson
 
 _LOGGER = logging.getLogger(__name__)
 
 RECONNECT_INTERVAL = 10
 MAX_RECONNECT_INTERVAL = 300
+MESSAGE_QUEUE_SIZE = 1024
+
+# WSMsgType values lowered to plain ints so the receive loop compares
+# integers instead of going through Enum.__eq__ per frame.
+_WS_TEXT = int(aiohttp.WSMsgType.TEXT)
+_WS_BINARY = int(aiohttp.WSMsgType.BINARY)
+_WS_ERROR = int(aiohttp.WSMsgType.ERROR)
+_WS_DATA = frozenset((_WS_TEXT, _WS_BINARY))
+_WS_CLOSED = frozenset(
+    (
+        int(aiohttp.WSMsgType.CLOSE),
+        int(aiohttp.WSMsgType.CLOSING),
+        int(aiohttp.WSMsgType.CLOSED),
+    )
+)
+
+
+_TYPE_TAG = '"type":"'
+_TYPE_TAG_B = b'"type":"'
+
+
+def _peek_message_type(raw: str | bytes) -> str | None:
+    """Extract the message type from a frame prefix without a full parse."""
+    head = raw[:64]
+    tag = _TYPE_TAG_B if isinstance(head, bytes) else _TYPE_TAG
+    quote = b'"' if isinstance(head, bytes) else '"'
+    start = head.find(tag)
+    if start == -1:
+        return None
+    start += len(tag)
+    end = head.find(quote, start)
+    if end == -1:
+        return None
+    msg_type = head[start:end]
+    return msg_type.decode() if isinstance(msg_type, bytes) else msg_type
+
+
+def install_fast_loop() -> bool:
+    """Install uvloop as the asyncio event loop policy when available.
+
+    Intended for standalone users of the library; Home Assistant manages
+    its own event loop. Returns True if uvloop was installed.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    uvloop.install()
+    return True
 
 
 class NeoHubError(Exception):
@@ -27,6 +77,47 @@ class NeoHubConnectionError(NeoHubError):
 class NeoHubClient:
     """WebSocket client for NeoHub."""
 
+    __slots__ = (
+        "host",
+        "port",
+        "ssl",
+        "access_token",
+        "_session",
+        "_ws",
+        "_state",
+        "_connected",
+        "_listen_task",
+        "_reconnect_task",
+        "_queue",
+        "_handler_task",
+        "_shutdown",
+        "_on_connect",
+        "_on_connect_snap",
+        "_on_disconnect",
+        "_on_disconnect_snap",
+        "_on_full_state",
+        "_on_full_state_snap",
+        "_on_partition_update",
+        "_on_partition_update_snap",
+        "_on_zone_update",
+        "_on_zone_update_snap",
+        "_on_error",
+        "_on_error_snap",
+        "_dispatch",
+        "_dispatch_message",
+        "_send_text",
+        "_pending_partition",
+        "_pending_zone",
+        "_flush_scheduled",
+    )
+
+    # Command payloads have a fixed shape, so they are formatted into
+    # pre-encoded templates instead of serializing a dict per call.
+    _ARM_AWAY_TMPL = b'{"type":"arm_away","session_id":%s,"partition_number":%d,"code":%s}'
+    _ARM_HOME_TMPL = b'{"type":"arm_home","session_id":%s,"partition_number":%d,"code":%s}'
+    _ARM_NIGHT_TMPL = b'{"type":"arm_night","session_id":%s,"partition_number":%d,"code":%s}'
+    _DISARM_TMPL = b'{"type":"disarm","session_id":%s,"partition_number":%d,"code":%s}'
+
     def __init__(
         self,
         host: str,
@@ -54,15 +145,44 @@ class NeoHubClient:
         self._connected = False
         self._listen_task: asyncio.Task | None = None
         self._reconnect_task: asyncio.Task | None = None
+        self._queue: asyncio.Queue[tuple[str | None, str | bytes]] | None = None
+        self._handler_task: asyncio.Task | None = None
         self._shutdown = False
         
-        # Callbacks
-        self._on_connect: list[Callable[[], None]] = []
-        self._on_disconnect: list[Callable[[], None]] = []
-        self._on_full_state: list[Callable[[dict[str, Any]], None]] = []
-        self._on_partition_update: list[Callable[[dict[str, Any]], None]] = []
-        self._on_zone_update: list[Callable[[dict[str, Any]], None]] = []
-        self._on_error: list[Callable[[str], None]] = []
+        # Callbacks: sets give O(1) unregister; the tuple snapshots are
+        # what the hot paths iterate.
+        self._on_connect: set[Callable[[], None]] = set()
+        self._on_connect_snap: tuple[Callable[[], None], ...] = ()
+        self._on_disconnect: set[Callable[[], None]] = set()
+        self._on_disconnect_snap: tuple[Callable[[], None], ...] = ()
+        self._on_full_state: set[Callable[[dict[str, Any]], None]] = set()
+        self._on_full_state_snap: tuple[Callable[[dict[str, Any]], None], ...] = ()
+        self._on_partition_update: set[Callable[[dict[str, Any]], None]] = set()
+        self._on_partition_update_snap: tuple[
+            Callable[[dict[str, Any]], None], ...
+        ] = ()
+        self._on_zone_update: set[Callable[[dict[str, Any]], None]] = set()
+        self._on_zone_update_snap: tuple[
+            Callable[[dict[str, Any]], None], ...
+        ] = ()
+        self._on_error: set[Callable[[str], None]] = set()
+        self._on_error_snap: tuple[Callable[[str], None], ...] = ()
+
+        # Updates coalesced per (session_id, number) within one loop tick
+        self._pending_partition: dict[tuple[Any, Any], dict[str, Any]] = {}
+        self._pending_zone: dict[tuple[Any, Any], dict[str, Any]] = {}
+        self._flush_scheduled = False
+
+        self._dispatch: dict[str, Callable[[dict[str, Any]], None]] = {
+            "full_state": self._handle_full_state,
+            "partition_update": self._handle_partition_update,
+            "zone_update": self._handle_zone_update,
+            "error": self._handle_error,
+        }
+        self._dispatch_message: Callable[[dict[str, Any]], None] = (
+            self._handle_message
+        )
+        self._send_text: Callable[[bytes], Awaitable[Any]] | None = None
 
     @property
     def connected(self) -> bool:
@@ -80,93 +200,130 @@ class NeoHubClient:
         scheme = "wss" if self.ssl else "ws"
         return f"{scheme}://{self.host}:{self.port}/api/ws"
 
+    def _register(
+        self, callbacks: set, snapshot_attr: str, callback: Callable
+    ) -> Callable[[], None]:
+        """Add a callback to a registry and refresh its snapshot tuple.
+
+        Returns:
+            A function to unregister the callback
+        """
+        callbacks.add(callback)
+        setattr(self, snapshot_attr, tuple(callbacks))
+
+        def _unregister() -> None:
+            callbacks.discard(callback)
+            setattr(self, snapshot_attr, tuple(callbacks))
+
+        return _unregister
+
     def register_connection_callback(
         self, callback: Callable[[], None]
     ) -> Callable[[], None]:
         """Register a callback for connection events.
-        
+
         Returns:
             A function to unregister the callback
         """
-        self._on_connect.append(callback)
-        return lambda: self._on_connect.remove(callback)
+        return self._register(self._on_connect, "_on_connect_snap", callback)
 
     def register_disconnection_callback(
         self, callback: Callable[[], None]
     ) -> Callable[[], None]:
         """Register a callback for disconnection events.
-        
+
         Returns:
             A function to unregister the callback
         """
-        self._on_disconnect.append(callback)
-        return lambda: self._on_disconnect.remove(callback)
+        return self._register(
+            self._on_disconnect, "_on_disconnect_snap", callback
+        )
 
     def register_full_state_callback(
         self, callback: Callable[[dict[str, Any]], None]
     ) -> Callable[[], None]:
         """Register a callback for full_state messages.
-        
+
         Returns:
             A function to unregister the callback
         """
-        self._on_full_state.append(callback)
-        return lambda: self._on_full_state.remove(callback)
+        return self._register(
+            self._on_full_state, "_on_full_state_snap", callback
+        )
 
     def register_partition_update_callback(
         self, callback: Callable[[dict[str, Any]], None]
     ) -> Callable[[], None]:
         """Register a callback for partition_update messages.
-        
+
         Returns:
             A function to unregister the callback
         """
-        self._on_partition_update.append(callback)
-        return lambda: self._on_partition_update.remove(callback)
+        return self._register(
+            self._on_partition_update, "_on_partition_update_snap", callback
+        )
 
     def register_zone_update_callback(
         self, callback: Callable[[dict[str, Any]], None]
     ) -> Callable[[], None]:
         """Register a callback for zone_update messages.
-        
+
         Returns:
             A function to unregister the callback
         """
-        self._on_zone_update.append(callback)
-        return lambda: self._on_zone_update.remove(callback)
+        return self._register(
+            self._on_zone_update, "_on_zone_update_snap", callback
+        )
 
     def register_error_callback(
         self, callback: Callable[[str], None]
     ) -> Callable[[], None]:
         """Register a callback for error messages.
-        
+
         Returns:
             A function to unregister the callback
         """
-        self._on_error.append(callback)
-        return lambda: self._on_error.remove(callback)
+        return self._register(self._on_error, "_on_error_snap", callback)
+
+    def _fire(self, callbacks: tuple[Callable, ...], *args: Any) -> None:
+        """Invoke callbacks, logging (not propagating) their exceptions."""
+        for callback in callbacks:
+            try:
+                callback(*args)
+            except Exception:
+                _LOGGER.exception("Error in callback %r", callback)
 
     async def connect(self) -> bool:
         """Connect to the WebSocket server and request initial state."""
         self._shutdown = False
         try:
-            self._session = aiohttp.ClientSession()
+            # Direct sends go through orjson already; json_serialize covers
+            # any send_json path on the session as well.
+            self._session = aiohttp.ClientSession(
+                json_serialize=lambda obj: orjson.dumps(obj).decode()
+            )
             headers: dict[str, str] = {}
             if self.access_token:
                 headers["Authorization"] = f"Bearer {self.access_token}"
 
+            # Messages are small JSON payloads on a local network, so
+            # per-message deflate costs more CPU than the bytes it saves.
             self._ws = await self._session.ws_connect(
                 self.ws_url,
                 headers=headers,
                 heartbeat=30,
+                compress=0,
             )
             self._connected = True
-            
-            for callback in self._on_connect:
-                callback()
+            self._send_text = self._resolve_text_sender()
+
+            self._fire(self._on_connect_snap)
 
             await self._send({"type": "get_full_state"})
 
+            self._queue = asyncio.Queue(maxsize=MESSAGE_QUEUE_SIZE)
+            self._dispatch_message = self._build_dispatcher()
+            self._handler_task = asyncio.create_task(self._consume())
             self._listen_task = asyncio.create_task(self._listen())
 
             _LOGGER.info("Connected to NeoHub at %s:%s", self.host, self.port)
@@ -193,49 +350,218 @@ class NeoHubClient:
         was_connected = self._connected
         self._connected = False
 
+        if self._handler_task is not None:
+            self._handler_task.cancel()
+            self._handler_task = None
+        self._queue = None
+        self._pending_partition.clear()
+        self._pending_zone.clear()
+
         if self._ws is not None and not self._ws.closed:
             await self._ws.close()
         self._ws = None
+        self._send_text = None
 
         if self._session is not None and not self._session.closed:
             await self._session.close()
         self._session = None
 
         if was_connected:
-            for callback in self._on_disconnect:
-                try:
-                    callback()
-                except Exception:
-                    _LOGGER.exception("Error in disconnection callback")
+            self._fire(self._on_disconnect_snap)
 
     async def _send(self, data: dict[str, Any]) -> None:
         """Send a JSON message over the WebSocket."""
-        if self._ws is not None and not self._ws.closed:
-            await self._ws.send_json(data)
+        await self._send_raw(orjson.dumps(data))
+
+    async def _send_raw(self, payload: bytes) -> None:
+        """Send a pre-encoded JSON payload over the WebSocket."""
+        send_text = self._send_text
+        if send_text is not None and self._ws is not None and not self._ws.closed:
+            await send_text(payload)
         else:
             _LOGGER.warning("Cannot send message, WebSocket not connected")
 
+    def _resolve_text_sender(self) -> Callable[[bytes], Awaitable[Any]]:
+        """Pick the cheapest path for sending an encoded TEXT frame.
+
+        orjson already produces UTF-8 bytes, but send_str requires a str
+        that aiohttp immediately re-encodes — a round trip that allocates
+        two throwaway copies per command. Handing the bytes straight to
+        the frame writer skips both. The writer entry point is private
+        and has shifted across aiohttp releases, so this probes the known
+        signatures and falls back to send_str when neither is present.
+        """
+        writer = getattr(self._ws, "_writer", None)
+        send_frame = getattr(writer, "send_frame", None)
+        if send_frame is not None:
+            opcode = aiohttp.WSMsgType.TEXT
+
+            async def _send(payload: bytes) -> None:
+                await send_frame(payload, opcode)
+
+            return _send
+        send = getattr(writer, "send", None)
+        if send is not None:
+
+            async def _send(payload: bytes) -> None:
+                await send(payload, binary=False)
+
+            return _send
+        ws = self._ws
+
+        async def _send(payload: bytes) -> None:
+            await ws.send_str(payload.decode())
+
+        return _send
+
+    async def _send_command(
+        self,
+        template: bytes,
+        session_id: str,
+        partition_number: int,
+        code: str | None,
+    ) -> None:
+        """Format a command template and send it."""
+        await self._send_raw(
+            template
+            % (orjson.dumps(session_id), partition_number, orjson.dumps(code))
+        )
+
+    def _should_skip_frame(self, peeked: str | None) -> bool:
+        """Return True if a frame can be dropped without parsing it.
+
+        Partition and zone updates received before the first full_state
+        have no state cache to apply to, so when nobody is listening for
+        them either, the JSON parse can be skipped entirely.
+        """
+        if self._state:
+            return False
+        if peeked == "partition_update":
+            return not self._on_partition_update
+        if peeked == "zone_update":
+            return not self._on_zone_update
+        return False
+
+    def _drain_buffered_frames(self) -> None:
+        """Handle TEXT frames already buffered by the reader without yielding.
+
+        When the server sends a burst of updates, the frames queue up in
+        aiohttp's reader between event-loop iterations. Draining them in a
+        tight loop amortizes the scheduler round trip that `async for`
+        would otherwise pay per frame. This relies on the reader's private
+        (message, size) buffer layout, so it bails out to the normal
+        receive path whenever the layout does not match.
+        """
+        reader = getattr(self._ws, "_reader", None)
+        buffer = getattr(reader, "_buffer", None)
+        if buffer is None:
+            return
+
+        try:
+            while buffer:
+                item = buffer[0]
+                if not (isinstance(item, tuple) and len(item) == 2):
+                    return
+                msg, size = item
+                if msg.type not in _WS_DATA:
+                    return
+                buffer.popleft()
+                reader._size -= size
+                peeked = _peek_message_type(msg.data)
+                if self._should_skip_frame(peeked):
+                    continue
+                self._enqueue(peeked, msg.data)
+        finally:
+            self._maybe_resume_reader(reader)
+
+    @staticmethod
+    def _maybe_resume_reader(reader: Any) -> None:
+        """Resume a paused transport after draining past the flow-control mark.
+
+        The reader normally resumes reading inside read(), which the
+        drain bypasses — without this step a transport paused during a
+        burst would starve every subsequent receive() until the heartbeat
+        tore the connection down.
+        """
+        limit = getattr(reader, "_limit", None)
+        protocol = getattr(reader, "_protocol", None)
+        if (
+            limit is None
+            or protocol is None
+            or reader._size >= limit
+            or not getattr(protocol, "_reading_paused", False)
+        ):
+            return
+        resume = getattr(protocol, "resume_reading", None)
+        if resume is not None:
+            resume()
+
+    def _enqueue(self, peeked: str | None, raw: str | bytes) -> None:
+        """Queue a raw frame for the handler task, dropping the oldest on overflow.
+
+        The type peeked from the frame prefix rides along so the consumer
+        can route the parsed message without re-reading its type field.
+        """
+        try:
+            self._queue.put_nowait((peeked, raw))
+        except asyncio.QueueFull:
+            _LOGGER.warning("Message queue full, dropping oldest message")
+            try:
+                self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+            self._queue.put_nowait((peeked, raw))
+
+    async def _consume(self) -> None:
+        """Parse and handle queued frames, decoupled from the reader.
+
+        Frames arrive with their type already peeked from the raw prefix,
+        so routing is a single dict lookup fused with the decode. The
+        peek is a heuristic prefix scan, so it is checked against the
+        parsed document before being trusted; mismatches and empty peeks
+        go through the generic dispatcher.
+        """
+        queue = self._queue
+        loads = orjson.loads
+        dispatch_get = self._dispatch.get
+        fallback = self._dispatch_message
+
+        while True:
+            peeked, raw = await queue.get()
+            try:
+                data = loads(raw)
+            except orjson.JSONDecodeError:
+                _LOGGER.error("Invalid JSON received: %s", raw)
+                continue
+            try:
+                handler = dispatch_get(peeked)
+                if handler is not None and data.get("type") == peeked:
+                    handler(data)
+                else:
+                    fallback(data)
+            except Exception:
+                _LOGGER.exception("Error handling message")
+
     async def _listen(self) -> None:
         """Listen for incoming WebSocket messages."""
+        # Bind hot-loop names locally to skip repeated attribute lookups.
+        enqueue = self._enqueue
+        drain = self._drain_buffered_frames
+
         try:
             assert self._ws is not None
             async for msg in self._ws:
-                if msg.type == aiohttp.WSMsgType.TEXT:
-                    try:
-                        data = json.loads(msg.data)
-                        self._handle_message(data)
-                    except json.JSONDecodeError:
-                        _LOGGER.error("Invalid JSON received: %s", msg.data)
-                    except Exception:
-                        _LOGGER.exception("Error handling message")
-                elif msg.type == aiohttp.WSMsgType.ERROR:
+                # BINARY frames skip aiohttp's UTF-8 decode and orjson
+                # parses the bytes natively, so accept both.
+                if msg.type == _WS_TEXT or msg.type == _WS_BINARY:
+                    peeked = _peek_message_type(msg.data)
+                    if not self._should_skip_frame(peeked):
+                        enqueue(peeked, msg.data)
+                    drain()
+                elif msg.type == _WS_ERROR:
                     _LOGGER.error("WebSocket error: %s", self._ws.exception())
                     break
-                elif msg.type in (
-                    aiohttp.WSMsgType.CLOSE,
-                    aiohttp.WSMsgType.CLOSING,
-                    aiohttp.WSMsgType.CLOSED,
-                ):
+                elif msg.type in _WS_CLOSED:
                     _LOGGER.warning(
                         "WebSocket closed by server (code=%s)",
                         getattr(msg, 'data', 'N/A'),
@@ -251,61 +577,172 @@ class NeoHubClient:
             self._reconnect_task = asyncio.create_task(self._reconnect())
 
     async def _reconnect(self) -> None:
-        """Reconnect with exponential backoff."""
-        interval = RECONNECT_INTERVAL
+        """Reconnect immediately, then back off exponentially with jitter."""
+        interval = 0
         while not self._shutdown:
-            _LOGGER.debug("Reconnecting in %s seconds", interval)
-            await asyncio.sleep(interval)
+            if interval:
+                _LOGGER.debug("Reconnecting in %s seconds", interval)
+                # Jitter de-synchronizes reconnect storms across instances.
+                await asyncio.sleep(interval + random.uniform(0, interval * 0.2))
             try:
                 if await self.connect():
                     return
             except NeoHubConnectionError:
                 pass
-            interval = min(interval * 2, MAX_RECONNECT_INTERVAL)
+            interval = (
+                min(interval * 2, MAX_RECONNECT_INTERVAL)
+                if interval
+                else RECONNECT_INTERVAL
+            )
+
+    def _build_dispatcher(self) -> Callable[[dict[str, Any]], None]:
+        """Compile a dispatcher specialized to the known message types.
+
+        The generated function compares the type against interned string
+        constants with branches ordered by steady-state frequency (zone
+        updates first), skipping the dict lookup and bound-method hop of
+        the generic _handle_message path.
+        """
+        src = (
+            'def _dispatch_message(data):\n'
+            '    t = data.get("type")\n'
+            '    if t == "zone_update":\n'
+            '        zu(data)\n'
+            '    elif t == "partition_update":\n'
+            '        pu(data)\n'
+            '    elif t == "full_state":\n'
+            '        fs(data)\n'
+            '    elif t == "error":\n'
+            '        er(data)\n'
+            '    else:\n'
+            '        unknown(t, data)\n'
+        )
+        namespace: dict[str, Any] = {
+            "zu": self._handle_zone_update,
+            "pu": self._handle_partition_update,
+            "fs": self._handle_full_state,
+            "er": self._handle_error,
+            "unknown": self._handle_unknown,
+        }
+        exec(compile(src, "<neohub-dispatch>", "exec"), namespace)
+        return namespace["_dispatch_message"]
 
     def _handle_message(self, data: dict[str, Any]) -> None:
         """Handle an incoming WebSocket message."""
         msg_type = data.get("type")
 
-        if msg_type == "full_state":
-            self._handle_full_state(data)
-        elif msg_type == "partition_update":
-            self._handle_partition_update(data)
-        elif msg_type == "zone_update":
-            self._handle_zone_update(data)
-        elif msg_type == "error":
-            error_msg = data.get("message", "Unknown error")
-            _LOGGER.error("NeoHub server error: %s", error_msg)
-            for callback in self._on_error:
-                try:
-                    callback(error_msg)
-                except Exception:
-                    _LOGGER.exception("Error in error callback")
+        handler = self._dispatch.get(msg_type)
+        if handler is not None:
+            handler(data)
         else:
-            _LOGGER.warning("Unknown message type '%s': %s", msg_type, data)
+            self._handle_unknown(msg_type, data)
+
+    def _handle_unknown(self, msg_type: Any, data: dict[str, Any]) -> None:
+        """Log an unrecognized message."""
+        _LOGGER.warning("Unknown message type '%s': %s", msg_type, data)
+
+    def _handle_error(self, data: dict[str, Any]) -> None:
+        """Process an error message."""
+        error_msg = data.get("message", "Unknown error")
+        _LOGGER.error("NeoHub server error: %s", error_msg)
+        self._fire(self._on_error_snap, error_msg)
+
+    @staticmethod
+    def _merge_items(
+        index: dict[int, dict[str, Any]],
+        items: list[dict[str, Any]],
+        key: str,
+    ) -> tuple[list[dict[str, Any]], dict[int, dict[str, Any]]]:
+        """Merge incoming items into cached dicts matched by number.
+
+        Returns the merged list and its rebuilt number index. Cached dicts
+        are updated in place so downstream holders keep valid references.
+        """
+        merged = []
+        new_index = {}
+        for item in items:
+            number = item.get(key)
+            if number is None:
+                # Keep number-less items in the list, but they cannot be
+                # matched against the cache or indexed.
+                merged.append(item)
+                continue
+            existing = index.get(number)
+            if existing is None:
+                existing = item
+            else:
+                existing.update(item)
+            merged.append(existing)
+            new_index[number] = existing
+        return merged, new_index
+
+    def _merge_session(
+        self, existing: dict[str, Any], session: dict[str, Any]
+    ) -> None:
+        """Merge a resynced session into the cached session in place."""
+        partitions, partition_index = self._merge_items(
+            existing["_partitions_by_number"],
+            session.get("partitions", []),
+            "partition_number",
+        )
+        zones, zone_index = self._merge_items(
+            existing["_zones_by_number"], session.get("zones", []), "zone_number"
+        )
+        existing.update(session)
+        existing["partitions"] = partitions
+        existing["_partitions_by_number"] = partition_index
+        existing["zones"] = zones
+        existing["_zones_by_number"] = zone_index
 
     def _handle_full_state(self, data: dict[str, Any]) -> None:
         """Process a full_state message."""
-        self._state = {}
+        # Deliver any coalesced updates first so callbacks observe events
+        # in wire order; an update parked behind this resync would
+        # otherwise replay stale data over the fresher full state.
+        if self._flush_scheduled:
+            self._flush_pending()
+
+        seen_ids = set()
+        partitions_total = 0
+        zones_total = 0
         for session in data.get("sessions", []):
             session_id = session.get("session_id")
             if session_id is None:
                 _LOGGER.error("Session missing session_id: %s", session)
                 continue
-            self._state[session_id] = session
-
-        _LOGGER.info(
-            "Received full state: %d session(s), %d partition(s), %d zone(s)",
-            len(self._state),
-            sum(len(s.get("partitions", [])) for s in self._state.values()),
-            sum(len(s.get("zones", [])) for s in self._state.values()),
-        )
+            seen_ids.add(session_id)
+            partitions_total += len(session.get("partitions", []))
+            zones_total += len(session.get("zones", []))
+
+            existing = self._state.get(session_id)
+            if existing is None:
+                session["_partitions_by_number"] = {
+                    number: partition
+                    for partition in session.get("partitions", [])
+                    if (number := partition.get("partition_number")) is not None
+                }
+                session["_zones_by_number"] = {
+                    number: zone
+                    for zone in session.get("zones", [])
+                    if (number := zone.get("zone_number")) is not None
+                }
+                self._state[session_id] = session
+            else:
+                self._merge_session(existing, session)
+
+        for session_id in list(self._state):
+            if session_id not in seen_ids:
+                del self._state[session_id]
+
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(
+                "Received full state: %d session(s), %d partition(s), %d zone(s)",
+                len(self._state),
+                partitions_total,
+                zones_total,
+            )
 
-        for callback in self._on_full_state:
-            try:
-                callback(data)
-            except Exception:
-                _LOGGER.exception("Error in full_state callback")
+        self._fire(self._on_full_state_snap, data)
 
     def _handle_partition_update(self, data: dict[str, Any]) -> None:
         """Process a partition_update message."""
@@ -319,18 +756,15 @@ class NeoHubClient:
             )
             return
 
-        if session_id in self._state:
-            for partition in self._state[session_id].get("partitions", []):
-                if partition["partition_number"] == partition_number:
-                    if "status" in data:
-                        partition["status"] = data["status"]
-                    break
+        session = self._state.get(session_id)
+        if session is not None:
+            partition = session["_partitions_by_number"].get(partition_number)
+            if partition is not None and "status" in data:
+                partition["status"] = data["status"]
 
-        for callback in self._on_partition_update:
-            try:
-                callback(data)
-            except Exception:
-                _LOGGER.exception("Error in partition_update callback")
+        self._queue_notification(
+            self._pending_partition, (session_id, partition_number), data
+        )
 
     def _handle_zone_update(self, data: dict[str, Any]) -> None:
         """Process a zone_update message."""
@@ -344,20 +778,49 @@ class NeoHubClient:
             )
             return
 
-        if session_id in self._state:
-            for zone in self._state[session_id].get("zones", []):
-                if zone["zone_number"] == zone_number:
-                    if "open" in data:
-                        zone["open"] = data["open"]
-                    if "partitions" in data:
-                        zone["partitions"] = data["partitions"]
-                    break
+        session = self._state.get(session_id)
+        if session is not None:
+            zone = session["_zones_by_number"].get(zone_number)
+            if zone is not None:
+                if "open" in data:
+                    zone["open"] = data["open"]
+                if "partitions" in data:
+                    zone["partitions"] = data["partitions"]
+
+        self._queue_notification(
+            self._pending_zone, (session_id, zone_number), data
+        )
 
-        for callback in self._on_zone_update:
-            try:
-                callback(data)
-            except Exception:
-                _LOGGER.exception("Error in zone_update callback")
+    def _queue_notification(
+        self,
+        pending: dict[tuple[Any, Any], dict[str, Any]],
+        key: tuple[Any, Any],
+        data: dict[str, Any],
+    ) -> None:
+        """Coalesce an update notification, newest fields winning."""
+        existing = pending.get(key)
+        if existing is None:
+            pending[key] = data
+        else:
+            existing.update(data)
+
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            asyncio.get_running_loop().call_soon(self._flush_pending)
+
+    def _flush_pending(self) -> None:
+        """Fire coalesced update callbacks, once per partition/zone."""
+        self._flush_scheduled = False
+
+        if self._pending_partition:
+            pending, self._pending_partition = self._pending_partition, {}
+            for data in pending.values():
+                self._fire(self._on_partition_update_snap, data)
+
+        if self._pending_zone:
+            pending, self._pending_zone = self._pending_zone, {}
+            for data in pending.values():
+                self._fire(self._on_zone_update_snap, data)
 
     # ── Commands ────────────────────────────────────────────────────────
 
@@ -365,50 +828,30 @@ class NeoHubClient:
         self, session_id: str, partition_number: int, code: str | None = None
     ) -> None:
         """Send an arm-away command."""
-        await self._send(
-            {
-                "type": "arm_away",
-                "session_id": session_id,
-                "partition_number": partition_number,
-                "code": code,
-            }
+        await self._send_command(
+            self._ARM_AWAY_TMPL, session_id, partition_number, code
         )
 
     async def arm_home(
         self, session_id: str, partition_number: int, code: str | None = None
     ) -> None:
         """Send an arm-home (stay) command."""
-        await self._send(
-            {
-                "type": "arm_home",
-                "session_id": session_id,
-                "partition_number": partition_number,
-                "code": code,
-            }
+        await self._send_command(
+            self._ARM_HOME_TMPL, session_id, partition_number, code
         )
 
     async def arm_night(
         self, session_id: str, partition_number: int, code: str | None = None
     ) -> None:
         """Send an arm-night command."""
-        await self._send(
-            {
-                "type": "arm_night",
-                "session_id": session_id,
-                "partition_number": partition_number,
-                "code": code,
-            }
+        await self._send_command(
+            self._ARM_NIGHT_TMPL, session_id, partition_number, code
         )
 
     async def disarm(
         self, session_id: str, partition_number: int, code: str | None = None
     ) -> None:
         """Send a disarm command."""
-        await self._send(
-            {
-                "type": "disarm",
-                "session_id": session_id,
-                "partition_number": partition_number,
-                "code": code,
-            }
+        await self._send_command(
+            self._DISARM_TMPL, session_id, partition_number, code
         )